@@ -0,0 +1,70 @@
+"""
+Compressed on-disk cache for numpy arrays.
+
+Stores intermediate pipeline arrays (rasterized images, mip levels, SDF
+buffers) as zstd-compressed blobs. On typical uint8 image data zstd
+compresses at GB/s with a 3-5x size reduction, so a cache hit is cheaper
+than re-decoding or re-computing the source.
+"""
+from pathlib import Path
+import json
+import struct
+import typing as t
+
+import numpy as np
+import zstandard
+
+import asset_pipeline.core.logging as logging
+
+logger = logging.get_logger(__name__)
+
+CACHE_MAGIC = b"GSAC"
+CACHE_FORMAT_VERSION = 1
+
+_HEADER_LEN_STRUCT = struct.Struct("<I")
+
+
+def save_array(array: np.ndarray, file_path: t.Union[str, Path], level: int = 3) -> Path:
+    """
+    Save an array to a compressed cache file.
+
+    :param array: Array to store
+    :param file_path: Destination file path
+    :param level: zstd compression level
+    :returns: Path to the saved cache file
+    """
+    file_path = Path(file_path)
+    header = json.dumps({"dtype": array.dtype.str, "shape": list(array.shape)}).encode("utf-8")
+    payload = zstandard.ZstdCompressor(level=level).compress(
+        np.ascontiguousarray(array).data.cast("B"))
+
+    with file_path.open("wb") as f:
+        f.write(CACHE_MAGIC)
+        f.write(bytes([CACHE_FORMAT_VERSION]))
+        f.write(_HEADER_LEN_STRUCT.pack(len(header)))
+        f.write(header)
+        f.write(payload)
+
+    logger.debug(f"Saved array cache file: {file_path}")
+    return file_path
+
+
+def load_array(file_path: t.Union[str, Path]) -> np.ndarray:
+    """
+    Load an array from a compressed cache file.
+
+    :param file_path: Source file path
+    :returns: The stored array
+    :raises ValueError: if the file is not a valid array cache file
+    """
+    file_path = Path(file_path)
+    raw = file_path.read_bytes()
+
+    if raw[:4] != CACHE_MAGIC:
+        raise ValueError(f"Not an array cache file: {file_path}")
+
+    (header_len,) = _HEADER_LEN_STRUCT.unpack_from(raw, 5)
+    header = json.loads(raw[9:9 + header_len])
+    payload = zstandard.ZstdDecompressor().decompress(raw[9 + header_len:])
+
+    return np.frombuffer(payload, dtype=np.dtype(header["dtype"])).reshape(header["shape"]).copy()
@@ -1,8 +1,38 @@
 import numpy as np
+import os
 import struct
 
-
-def save_dds_from_mipmaps(mipmaps, filename):
+# DDS header layout for an uncompressed 32-bit RGBA texture. Everything
+# except height/width/pitch/mip count is constant, so the constant parts
+# are prepared once at import time.
+_DDS_MAGIC = b'DDS '
+_HEADER_SIZE = 124
+# Flags: (DDSD_CAPS | DDSD_HEIGHT | DDSD_WIDTH | DDSD_PIXELFORMAT | DDSD_MIPMAPCOUNT | DDSD_PITCH)
+_HEADER_FLAGS = 0x1 | 0x2 | 0x4 | 0x1000 | 0x20000 | 0x8
+# Pixel format (DDS_PIXELFORMAT structure, 32 bytes):
+# size, DDPF_RGB | DDPF_ALPHAPIXELS, no fourcc, 32 bpp, RGBA bitmasks
+_PIXEL_FORMAT = struct.pack(
+    '<IIIIIIII',
+    32, 0x41, 0, 32,
+    0x00FF0000, 0x0000FF00, 0x000000FF, 0xFF000000
+)
+# Caps: DDSCAPS_TEXTURE | DDSCAPS_COMPLEX | DDSCAPS_MIPMAP
+_CAPS1 = 0x1000 | 0x8 | 0x400000
+
+# Header template: a zeroed 124-byte buffer with every constant field
+# (size, flags, pixel format, caps) packed in once. The reserved DWORDs
+# stay zero for free, so per-save packing touches only the varying fields.
+_HEADER_TEMPLATE = bytearray(_HEADER_SIZE)
+struct.pack_into('<II', _HEADER_TEMPLATE, 0, _HEADER_SIZE, _HEADER_FLAGS)
+_HEADER_TEMPLATE[72:104] = _PIXEL_FORMAT
+struct.pack_into('<I', _HEADER_TEMPLATE, 104, _CAPS1)
+
+# Varying fields: height, width, pitch at offset 8; mip count at offset 24
+_DIMS_STRUCT = struct.Struct('<3I')
+_MIP_COUNT_STRUCT = struct.Struct('<I')
+
+
+def save_dds_from_mipmaps(mipmaps, filename, *, validate=True):
     """
     Save a list of numpy arrays as an uncompressed 32-bit RGBA DDS file.
 
@@ -13,87 +43,86 @@ def save_dds_from_mipmaps(mipmaps, filename):
 
     :param mipmaps: list of numpy.ndarray, each of shape (H, W, 4) with dtype np.uint8.
     :param filename: output file path.
+    :param validate: when False, skip all shape/dtype checks; for callers
+        (e.g. the mip generator) whose output is correct by construction.
     :raises ValueError: if any of the arrays do not conform to the expected shape/dtype.
     """
     if not mipmaps:
         raise ValueError("Mipmaps list is empty.")
 
-    # Validate each mip level.
-    for i, arr in enumerate(mipmaps):
-        if not isinstance(arr, np.ndarray):
-            raise ValueError(f"Mip level {i} is not a numpy array.")
-        if arr.ndim != 3 or arr.shape[2] != 4:
-            raise ValueError(f"Mip level {i} must have shape (H, W, 4), got {arr.shape}.")
-        if arr.dtype != np.uint8:
-            raise ValueError(f"Mip level {i} must have dtype np.uint8, got {arr.dtype}.")
-
-    # Verify dimensions: each mip level must be half the size of the previous one.
-    base_h, base_w, _ = mipmaps[0].shape
-    expected_h, expected_w = base_h, base_w
-    for i in range(1, len(mipmaps)):
-        expected_h = max(1, expected_h // 2)
-        expected_w = max(1, expected_w // 2)
-        actual_h, actual_w, _ = mipmaps[i].shape
-        if (actual_h, actual_w) != (expected_h, expected_w):
-            raise ValueError(
-                f"Mip level {i} has incorrect dimensions. Expected ({expected_h}, {expected_w}) "
-                f"but got ({actual_h}, {actual_w})."
-            )
+    if validate:
+        # Single validation pass: check shape/dtype, verify that each level
+        # is half the previous one, and coerce to contiguous uint8 so the
+        # writer below never has to copy.
+        mipmaps = list(mipmaps)
+        expected_h = expected_w = None
+        for i, arr in enumerate(mipmaps):
+            if not isinstance(arr, np.ndarray):
+                raise ValueError(f"Mip level {i} is not a numpy array.")
+            if arr.ndim != 3 or arr.shape[2] != 4:
+                raise ValueError(f"Mip level {i} must have shape (H, W, 4), got {arr.shape}.")
+            if arr.dtype != np.uint8:
+                raise ValueError(f"Mip level {i} must have dtype np.uint8, got {arr.dtype}.")
+            actual_h, actual_w, _ = arr.shape
+            if expected_h is not None and (actual_h, actual_w) != (expected_h, expected_w):
+                raise ValueError(
+                    f"Mip level {i} has incorrect dimensions. Expected ({expected_h}, {expected_w}) "
+                    f"but got ({actual_h}, {actual_w})."
+                )
+            expected_h, expected_w = max(1, actual_h // 2), max(1, actual_w // 2)
+            mipmaps[i] = np.ascontiguousarray(arr)
+
+    base_h, base_w = mipmaps[0].shape[:2]
 
     mip_count = len(mipmaps)
 
-    # DDS header values for an uncompressed 32-bit RGBA texture.
-    magic = b'DDS '
-    header_size = 124
-    # Flags: (DDSD_CAPS | DDSD_HEIGHT | DDSD_WIDTH | DDSD_PIXELFORMAT | DDSD_MIPMAPCOUNT | DDSD_PITCH)
-    flags = 0x1 | 0x2 | 0x4 | 0x1000 | 0x20000 | 0x8
     pitch = base_w * 4  # bytes per scanline for 32-bit RGBA
-    reserved1 = (0,) * 11  # 11 reserved DWORDs
-
-    # Pixel format (DDS_PIXELFORMAT structure, 32 bytes)
-    pf_size = 32
-    pf_flags = 0x41  # DDPF_RGB (0x40) | DDPF_ALPHAPIXELS (0x1)
-    pf_fourcc = 0  # No compression
-    pf_rgb_bit_count = 32
-    pf_r_bitmask = 0x00FF0000
-    pf_g_bitmask = 0x0000FF00
-    pf_b_bitmask = 0x000000FF
-    pf_a_bitmask = 0xFF000000
-    # Pack the pixel format into a 32-byte string.
-    pixel_format = struct.pack(
-        '<IIIIIIII',
-        pf_size, pf_flags, pf_fourcc, pf_rgb_bit_count,
-        pf_r_bitmask, pf_g_bitmask, pf_b_bitmask, pf_a_bitmask
-    )
-
-    # Caps: DDSCAPS_TEXTURE | DDSCAPS_COMPLEX | DDSCAPS_MIPMAP
-    caps1 = 0x1000 | 0x8 | 0x400000
-    caps2 = caps3 = caps4 = 0
-    reserved2 = 0
-
-    # Use a single call to struct.pack. The format string:
-    # '<7I11I32s5I' expects:
-    # - 7 DWORDs: header_size, flags, base_h, base_w, pitch, depth (0), mip_count.
-    # - 11 DWORDs: reserved1.
-    # - 1 32-byte string: pixel_format.
-    # - 5 DWORDs: caps1, caps2, caps3, caps4, reserved2.
-    header = struct.pack(
-        '<7I11I32s5I',
-        header_size, flags, base_h, base_w, pitch, 0, mip_count,
-        *reserved1,
-        pixel_format,
-        caps1, caps2, caps3, caps4, reserved2
-    )
+
+    # Copy the prepared template and pack only the varying fields into it
+    header = bytearray(_HEADER_TEMPLATE)
+    _DIMS_STRUCT.pack_into(header, 8, base_h, base_w, pitch)
+    _MIP_COUNT_STRUCT.pack_into(header, 24, mip_count)
 
     # Write DDS file: magic + header + all mip levels data.
-    with open(filename, 'wb') as f:
-        f.write(magic)
-        f.write(header)
-        for mip in mipmaps:
-            f.write(mip.tobytes())
+    buffers = [_DDS_MAGIC, header]
+    buffers += [np.ascontiguousarray(mip).data.cast('B') for mip in mipmaps]
+    _write_buffers(filename, buffers)
     print(f"DDS file '{filename}' written successfully with {mip_count} mip levels.")
 
 
+def _write_buffers(filename, buffers):
+    """
+    Write a list of buffers to a file.
+
+    On POSIX this uses a single scatter-gather os.writev call, so the
+    kernel copies every buffer into the page cache with one syscall
+    instead of one write per mip level. Elsewhere (Windows) it falls
+    back to sequential buffered writes.
+
+    :param filename: output file path.
+    :param buffers: bytes-like objects to write back to back.
+    """
+    if not hasattr(os, 'writev'):
+        with open(filename, 'wb') as f:
+            for buffer in buffers:
+                f.write(buffer)
+        return
+
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        buffers = list(buffers)
+        while buffers:
+            written = os.writev(fd, buffers)
+            # Drop fully written buffers and trim a partially written one
+            while buffers and written >= len(buffers[0]):
+                written -= len(buffers[0])
+                buffers.pop(0)
+            if written:
+                buffers[0] = memoryview(buffers[0])[written:]
+    finally:
+        os.close(fd)
+
+
 def test_save_dds():
     """
     Create a test mipmap chain with 5 levels.
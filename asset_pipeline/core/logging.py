@@ -1,3 +1,4 @@
+import functools
 import typing as t
 import logging
 
@@ -41,6 +42,9 @@ def setup_logging(level: LogLevel = "INFO",) -> None:
     logging.debug("Logging configured")
 
 
+# Loggers are immutable lookups for our purposes: caching skips the
+# logging.Manager dict walk and the setLevel call on repeated requests.
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str, level: t.Optional[LogLevel] = None) -> logging.Logger:
     """
     Get a logger with the specified name and optional level.
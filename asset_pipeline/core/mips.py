@@ -0,0 +1,177 @@
+import numpy as np
+import typing as t
+
+import asset_pipeline.core.logging as logging
+# Numba JIT-compiles the downsample kernel into fused, row-parallel
+# machine code; the NumPy reduction below is used when it is absent.
+from asset_pipeline.core.numba_support import njit, prange
+
+logger = logging.get_logger(__name__)
+
+
+def get_num_mips(width: int, height: int) -> int:
+    """
+    Number of mip levels in a full chain from (width, height) down to 1x1.
+
+    :param width: Base level width in pixels
+    :param height: Base level height in pixels
+    :return: Mip level count including the base level
+    """
+    # bit_length() is the exact integer log2+1 for powers of two, with no
+    # libm call or float rounding at the boundaries.
+    return max(width, height).bit_length()
+
+
+def get_all_mipmap_coordinates(base_width: int, base_height: int,
+                               num_mips: t.Optional[int] = None
+                               ) -> t.List[t.Tuple[int, int, int, int]]:
+    """
+    Coordinates of every mip level in a horizontal mip atlas.
+
+    Levels sit side by side starting with the base level at x=0, so the
+    x offset of level k is the sum of all previous level widths. The
+    offsets are computed in one vectorized cumsum rather than a Python
+    loop over levels.
+
+    :param base_width: Width of the base level in pixels
+    :param base_height: Height of the base level in pixels
+    :param num_mips: Level count, defaults to the full chain down to 1x1
+    :return: List of (x, y, width, height) tuples, one per level
+    """
+    if num_mips is None:
+        num_mips = get_num_mips(base_width, base_height)
+
+    levels = np.arange(num_mips)
+    widths = np.maximum(base_width >> levels, 1)
+    heights = np.maximum(base_height >> levels, 1)
+    x_offsets = np.concatenate(([0], np.cumsum(widths[:-1])))
+
+    return list(zip(x_offsets.tolist(), [0] * num_mips, widths.tolist(), heights.tolist()))
+
+
+def _downsample_2x2(level: np.ndarray) -> np.ndarray:
+    """
+    Halve a mip level with a rounded 2x2 box average.
+
+    Sums run in uint16 so a 2x2 block of uint8 values cannot overflow;
+    the +2 rounds to nearest instead of truncating.
+
+    :param level: Source level with shape (H, W, 4) and dtype np.uint8
+    :return: Downsampled level with shape (max(1, H//2), max(1, W//2), 4)
+    """
+    height, width = level.shape[:2]
+    sums = level.astype(np.uint16)
+    if height > 1:
+        sums = sums[0::2] + sums[1::2]
+    else:
+        sums = sums * 2
+    if width > 1:
+        sums = sums[:, 0::2] + sums[:, 1::2]
+    else:
+        sums = sums * 2
+    return ((sums + 2) >> 2).astype(np.uint8)
+
+
+def _downsample_2x2_kernel(src: np.ndarray, dst: np.ndarray) -> None:
+    """
+    Rounded 2x2 box average written as explicit loops for Numba.
+
+    Rows are split across threads with prange and the fixed-length
+    channel loop vectorizes to SIMD; the arithmetic matches
+    _downsample_2x2 exactly.
+
+    :param src: Source level with shape (H, W, 4) and dtype np.uint8
+    :param dst: Preallocated destination with shape (H//2, W//2, 4)
+    """
+    for y in prange(dst.shape[0]):
+        for x in range(dst.shape[1]):
+            for c in range(4):
+                dst[y, x, c] = (int(src[2 * y, 2 * x, c]) + int(src[2 * y, 2 * x + 1, c])
+                                + int(src[2 * y + 1, 2 * x, c]) + int(src[2 * y + 1, 2 * x + 1, c])
+                                + 2) >> 2
+
+
+if njit is not None:
+    _downsample_2x2_kernel = njit(parallel=True, fastmath=True, cache=True)(_downsample_2x2_kernel)
+
+
+def _generate_levels_gpu(image: np.ndarray, num_levels: int) -> t.List[np.ndarray]:
+    """
+    Compute the downsampled levels on the GPU via cupy.
+
+    Runs the same rounded 2x2 box average as the CPU path; discrete-GPU
+    memory bandwidth makes the reduction chain effectively free for
+    large base images.
+
+    :param image: Base level with shape (H, W, 4) and dtype np.uint8
+    :param num_levels: Number of levels to generate below the base
+    :return: List of downsampled levels as numpy arrays
+    """
+    import cupy as cp
+
+    levels = []
+    current = cp.asarray(image)
+    for _ in range(num_levels):
+        height, width = current.shape[:2]
+        sums = current.astype(cp.uint16)
+        if height > 1:
+            sums = sums[0::2] + sums[1::2]
+        else:
+            sums = sums * 2
+        if width > 1:
+            sums = sums[:, 0::2] + sums[:, 1::2]
+        else:
+            sums = sums * 2
+        current = ((sums + 2) >> 2).astype(cp.uint8)
+        levels.append(cp.asnumpy(current))
+    return levels
+
+
+def generate_mipmaps(image: np.ndarray, backend: str = "cpu") -> t.List[np.ndarray]:
+    """
+    Generate a full mip chain from a level-0 RGBA image.
+
+    Each level is a 2x2 box average of the previous one, computed as a
+    single vectorized reduction per level, so the total work is only
+    ~4/3 of the base image. The output matches what
+    save_dds_from_mipmaps expects.
+
+    :param image: Base level with shape (H, W, 4), dtype np.uint8 and
+                  power-of-two dimensions
+    :param backend: "cpu" (default) or "gpu"; the GPU path needs cupy and
+                    falls back to the CPU when it is unavailable
+    :return: List of mip levels with mipmaps[0] as the base image
+    :raises ValueError: if the image does not conform to the expected shape/dtype
+    """
+    if not isinstance(image, np.ndarray):
+        raise ValueError("Image is not a numpy array.")
+    if image.ndim != 3 or image.shape[2] != 4:
+        raise ValueError(f"Image must have shape (H, W, 4), got {image.shape}.")
+    if image.dtype != np.uint8:
+        raise ValueError(f"Image must have dtype np.uint8, got {image.dtype}.")
+
+    base_height, base_width = image.shape[:2]
+    if base_height & (base_height - 1) or base_width & (base_width - 1):
+        raise ValueError(f"Image dimensions must be powers of two, got ({base_height}, {base_width}).")
+
+    num_levels = get_num_mips(base_width, base_height) - 1
+
+    if backend == "gpu":
+        try:
+            return [image] + _generate_levels_gpu(image, num_levels)
+        except ImportError:
+            logger.warning("GPU mip backend requested but cupy is not installed, using CPU")
+
+    mipmaps = [image]
+    for _ in range(num_levels):
+        prev = mipmaps[-1]
+        height, width = prev.shape[:2]
+        if njit is not None and height > 1 and width > 1:
+            nxt = np.empty((height // 2, width // 2, 4), dtype=np.uint8)
+            _downsample_2x2_kernel(np.ascontiguousarray(prev), nxt)
+            mipmaps.append(nxt)
+        else:
+            mipmaps.append(_downsample_2x2(prev))
+
+    logger.debug(f"Generated {len(mipmaps)} mip levels from base size ({base_height}, {base_width})")
+    return mipmaps
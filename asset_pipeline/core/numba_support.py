@@ -0,0 +1,30 @@
+"""
+Shared numba import shim with a stable on-disk JIT cache.
+
+The pipeline ships as a PyInstaller one-file exe (devtools/build.py),
+which extracts itself into a fresh _MEI* temp directory on every launch.
+Numba's default cache location lives next to the source files, so inside
+the bundle every run starts with a cold cache and pays full JIT
+compilation again. Pointing NUMBA_CACHE_DIR at a per-user directory
+before numba is imported makes cache=True kernels persist across runs,
+frozen or not.
+
+Kernels import njit/prange from here; when numba is absent njit is None
+and prange is the plain range, so undecorated kernels still run as
+ordinary Python.
+"""
+import os
+
+if "NUMBA_CACHE_DIR" not in os.environ:
+    _cache_root = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    _cache_dir = os.path.join(_cache_root, "asset_pipeline", "numba")
+    os.makedirs(_cache_dir, exist_ok=True)
+    os.environ["NUMBA_CACHE_DIR"] = _cache_dir
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    njit = None
+    prange = range
+    HAS_NUMBA = False
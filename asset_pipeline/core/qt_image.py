@@ -1,17 +1,47 @@
-from PySide6.QtCore import QRectF
-from PySide6.QtGui import QImage, QPainter
-from PySide6.QtSvg import QSvgRenderer
+from __future__ import annotations
+
 from pathlib import Path
+import functools
 import typing as t
-import numpy as np
-import math
 import os
 import stat
 
 import asset_pipeline.core.logging as logging
 
+# PySide6 and numpy are imported lazily inside the functions that need
+# them: together they account for most of this package's import time,
+# and callers that only need the sizing helpers shouldn't pay for Qt.
+if t.TYPE_CHECKING:
+    from PySide6.QtGui import QImage
+    import numpy as np
+
 logger = logging.get_logger(__name__)
 
+# Render-target pool for svg_to_image: batch runs render hundreds of
+# SVGs at the same resolution, and a 4096x4096 RGBA target is 64 MB,
+# so the buffer is recycled between files instead of reallocated.
+_image_pool: t.Dict[t.Tuple[int, int], QImage] = {}
+
+# Lazily created QGuiApplication shared by the whole batch (one per
+# worker process); Qt's SVG and font machinery require one to exist.
+_app = None
+
+
+def ensure_app() -> None:
+    """
+    Create the shared QGuiApplication if none exists yet.
+
+    Safe to call once per file: after the first call it is a no-op, so
+    per-invocation Qt init cost is paid exactly once per process.
+    """
+    global _app
+    if _app is None:
+        from PySide6.QtGui import QGuiApplication
+
+        _app = QGuiApplication.instance()
+        if _app is None:
+            _app = QGuiApplication([])
+
 
 def nearest_power_of_2(n: float, threshold: float = 0.05) -> int:
     """
@@ -22,12 +52,17 @@ def nearest_power_of_2(n: float, threshold: float = 0.05) -> int:
     """
     if n <= 0:
         return 0
-    lower = 2 ** math.floor(math.log2(n))
-    higher = 2 ** math.ceil(math.log2(n))
+    # bit_length() brackets n between powers of two with integer ops,
+    # avoiding the float log2/floor/ceil round trip.
+    higher = 1 << int(n).bit_length()
+    lower = higher >> 1 if higher > 1 else 1
     # If the gap between n and lower is small relative to lower, stick with lower.
     return lower if (n - lower) / lower < threshold else higher
 
 
+# Batch runs only use a handful of (bounds, resolution, margin)
+# combinations, so the pure math below caches extremely well.
+@functools.lru_cache(maxsize=1024)
 def calculate_render_dimensions(svg_bounds: t.Tuple[float, float],
                                 max_resolution: int,
                                 margin: float
@@ -76,6 +111,10 @@ def svg_to_image(svg_path: t.Union[str, Path], max_resolution: int = 512, margin
 
     Creates a transparent QImage and renders the SVG content onto it.
 
+    The returned image is owned by a per-size pool and is reused by the
+    next call that renders at the same texture size; finish with it (or
+    copy the pixels) before converting another SVG.
+
     Args:
         svg_path: Path to the SVG file as a string or Path object
         max_resolution:
@@ -84,6 +123,9 @@ def svg_to_image(svg_path: t.Union[str, Path], max_resolution: int = 512, margin
     Returns:
         QImage: The rendered image if successful, None otherwise
     """
+    from PySide6.QtCore import QRectF
+    from PySide6.QtGui import QImage, QPainter
+    from PySide6.QtSvg import QSvgRenderer
 
     # Create SVG renderer
     renderer = QSvgRenderer(str(svg_path) if isinstance(svg_path, Path) else svg_path)
@@ -91,8 +133,11 @@ def svg_to_image(svg_path: t.Union[str, Path], max_resolution: int = 512, margin
 
     texture_size, render_rect = calculate_render_dimensions((svg_size.width(), svg_size.height()), max_resolution, margin)
 
-    # Create a blank transparent image
-    image = QImage(texture_size[0], texture_size[1], QImage.Format_ARGB32)
+    # Reuse a pooled render target of this size, or allocate it once
+    image = _image_pool.get(texture_size)
+    if image is None:
+        image = QImage(texture_size[0], texture_size[1], QImage.Format_RGBA8888)
+        _image_pool[texture_size] = image
     image.fill(0)  # Fill with transparency (0 = fully transparent)
 
     # Set up the painter for the image
@@ -110,16 +155,21 @@ def svg_to_image(svg_path: t.Union[str, Path], max_resolution: int = 512, margin
         return None
 
 
-def image_to_numpy(image: QImage) -> np.ndarray:
+def image_to_numpy(image: QImage, copy: bool = True) -> np.ndarray:
     """
     Convert a QImage to a numpy array.
 
     :param image: Input QImage object
-    :return: Numpy array with shape (height, width, 4) in BGRA format
+    :param copy: When False, return a view into the QImage pixel buffer
+                 instead of copying; the caller must keep the image alive
+                 for as long as the array is used
+    :return: Numpy array with shape (height, width, 4) in RGBA format
     """
+    from PySide6.QtGui import QImage
+    import numpy as np
 
-    # Ensure the QImage is in the format of 32-bit ARGB (4 channels)
-    image = image.convertToFormat(QImage.Format_ARGB32)
+    # Ensure the QImage is in 32-bit RGBA memory order (4 channels)
+    image = image.convertToFormat(QImage.Format_RGBA8888)
 
     # QImage's bits() returns a memoryview in PySide6
     buffer = image.constBits()
@@ -127,36 +177,50 @@ def image_to_numpy(image: QImage) -> np.ndarray:
     # Get size and create numpy array
     buffer_size = image.sizeInBytes()
 
-    # Create a copy of the data
-    img_array = np.array(buffer[:buffer_size], dtype=np.uint8).reshape(
+    # Wrap the pixel buffer directly; with copy=True the single .copy()
+    # is one C-level memcpy, with copy=False no pixel data moves at all
+    img_array = np.frombuffer(buffer, dtype=np.uint8, count=buffer_size).reshape(
         image.height(), image.width(), 4)
 
-    # Note: the format is actually BGRA in memory
-    return img_array
+    return img_array.copy() if copy else img_array
 
 
 def numpy_to_image(img_array: np.ndarray) -> QImage | None:
     """
     Converts a NumPy array to a QImage.
 
-    :param img_array: Input image as a NumPy array in Grayscale or BGRA format.
+    :param img_array: Input image as a NumPy array in Grayscale or RGBA format.
     :return: Corresponding QImage object if successful, otherwise None.
     """
+    from PySide6.QtGui import QImage
+    import numpy as np
 
-    # Ensure array is contiguous and uint8
-    img_array = np.ascontiguousarray(img_array).astype(np.uint8)
+    # Ensure array is contiguous and uint8; pipeline arrays already are,
+    # so in the common case neither conversion copies
+    if img_array.dtype != np.uint8:
+        img_array = img_array.astype(np.uint8)
+    if not img_array.flags["C_CONTIGUOUS"]:
+        img_array = np.ascontiguousarray(img_array)
+
+    image = None
 
     # Grayscale image
     if len(img_array.shape) == 2:
         height, width = img_array.shape
         logger.debug(f"Converting grayscale image ({width}x{height}) to QImage.")
-        return QImage(img_array.data, width, height, width, QImage.Format_Grayscale8)
+        image = QImage(img_array.data, width, height, width, QImage.Format_Grayscale8)
 
-    # BGRA image
+    # RGBA image
     elif len(img_array.shape) == 3 and img_array.shape[2] == 4:
         height, width, channels = img_array.shape
-        logger.debug(f"Converting BGRA image ({width}x{height}) to QImage.")
-        return QImage(img_array.data, width, height, width * channels, QImage.Format_ARGB32)
+        logger.debug(f"Converting RGBA image ({width}x{height}) to QImage.")
+        image = QImage(img_array.data, width, height, width * channels, QImage.Format_RGBA8888)
+
+    if image is not None:
+        # The QImage wraps the array's buffer without copying; keep the
+        # array alive for as long as the image exists
+        image._array_ref = img_array
+        return image
 
     # Unsupported format
     logger.warning(f"Unsupported array format: shape {img_array.shape}, dtype {img_array.dtype}")
@@ -1,5 +1,6 @@
 from pathlib import Path
 import argparse
+import multiprocessing
 import asset_pipeline.core.logging as logging
 import asset_pipeline.processors.sdf.processor as processor
 import asset_pipeline.processors.sdf.config as cfg
@@ -27,4 +28,7 @@ def main() -> None:
     processor.process_sdf(config)
 
 if __name__ == "__main__":
+    # In the frozen one-file exe, Windows pool workers re-execute this
+    # entry point; freeze_support() diverts them before argparse runs.
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -9,13 +9,20 @@ import asset_pipeline.core.logging as logging
 logger = logging.get_logger(__name__)
 
 
-SDF_CHANNEL_MAPPING = (0, 1, 2, 3)  # BGRA -> BGRA
+SDF_CHANNEL_MAPPING = (0, 1, 2, 3)  # RGBA -> RGBA
 
 OUTPUT_FILE_EXT = '.png'
 OUTPUT_FILE_PREFIX = 'T_'
 OUTPUT_FILE_POSTFIXES = {
     QImage.Format_Grayscale8: '_SDF',
-    QImage.Format_ARGB32: '_MSDF',
+    QImage.Format_RGBA8888: '_MSDF',
+}
+
+# Same postfixes keyed by SDF channel count, so the output name can be
+# chosen from the numpy array without a QImage in hand
+OUTPUT_FILE_POSTFIXES_BY_CHANNELS = {
+    1: '_SDF',
+    4: '_MSDF',
 }
 
 METADATA_EXTENSION = ".gsam"
@@ -35,6 +42,11 @@ class SdfProcessorConfig:
     max_relative_distance: float = 0.03
     version: int = 1
 
+    @property
+    def downsample_factor(self) -> int:
+        """Ratio between the rasterization size and the output size."""
+        return self.svg_rasterization_size // self.max_output_size
+
 
 def save_config(config: SdfProcessorConfig, config_path: t.Union[str, Path]) -> Path:
     """
@@ -0,0 +1,181 @@
+"""
+Signed Euclidean distance transform for SDF generation.
+
+Implements Felzenszwalb & Huttenlocher's two-pass lower-envelope squared
+EDT. With numba installed the kernels JIT-compile to row-parallel machine
+code that releases the GIL, replacing the two scipy
+distance_transform_edt calls per channel; without numba the converter
+keeps its scipy path and these functions remain plain Python, covered by
+the scipy-parity tests in tests/test_edt.py on small masks.
+"""
+import numpy as np
+
+import asset_pipeline.core.logging as logging
+from asset_pipeline.core.numba_support import njit, prange, HAS_NUMBA
+
+logger = logging.get_logger(__name__)
+
+# Stand-in for infinity: larger than any squared pixel distance we can
+# produce, but finite so the envelope intersections stay well-defined
+# under fastmath.
+_BIG = np.float32(1e12)
+
+
+def _edt_1d(f: np.ndarray, d: np.ndarray, v: np.ndarray, z: np.ndarray, n: int) -> None:
+    """
+    1D squared EDT of a sampled function via the parabola lower envelope.
+
+    :param f: Input samples (squared distances so far), length n
+    :param d: Output buffer, length n
+    :param v: Scratch buffer for parabola vertices, length n
+    :param z: Scratch buffer for envelope boundaries, length n + 1
+    :param n: Number of samples
+    """
+    k = 0
+    v[0] = 0
+    z[0] = -_BIG
+    z[1] = _BIG
+    for q in range(1, n):
+        s = ((f[q] + q * q) - (f[v[k]] + v[k] * v[k])) / (2 * q - 2 * v[k])
+        while s <= z[k]:
+            k -= 1
+            s = ((f[q] + q * q) - (f[v[k]] + v[k] * v[k])) / (2 * q - 2 * v[k])
+        k += 1
+        v[k] = q
+        z[k] = s
+        z[k + 1] = _BIG
+    k = 0
+    for q in range(n):
+        while z[k + 1] < q:
+            k += 1
+        d[q] = (q - v[k]) * (q - v[k]) + f[v[k]]
+
+
+def _edt_sq_2d(f: np.ndarray) -> None:
+    """
+    In-place 2D squared EDT: a row pass followed by a column pass.
+
+    Rows (and then columns) are independent, so both passes split across
+    threads with prange when jitted.
+
+    :param f: Seed function (0 at seeds, _BIG elsewhere), modified in place
+    """
+    height, width = f.shape
+    for y in prange(height):
+        d = np.empty(width, np.float32)
+        v = np.empty(width, np.int32)
+        z = np.empty(width + 1, np.float32)
+        _edt_1d(f[y], d, v, z, width)
+        f[y] = d
+    for x in prange(width):
+        col = np.empty(height, np.float32)
+        for y in range(height):
+            col[y] = f[y, x]
+        d = np.empty(height, np.float32)
+        v = np.empty(height, np.int32)
+        z = np.empty(height + 1, np.float32)
+        _edt_1d(col, d, v, z, height)
+        for y in range(height):
+            f[y, x] = d[y]
+
+
+def _signed_edt(mask: np.ndarray) -> np.ndarray:
+    """
+    Signed distance field of a boolean mask.
+
+    Seeds a single transform from the boundary pixels (background pixels
+    with a foreground 4-neighbour) and signs the unsigned result by the
+    mask bit, so only one EDT runs instead of one per polarity.
+
+    :param mask: Boolean foreground mask with shape (H, W)
+    :return: float32 field, positive inside the mask, negative outside
+    """
+    height, width = mask.shape
+    f = np.empty((height, width), np.float32)
+    for y in prange(height):
+        for x in range(width):
+            seed = False
+            if not mask[y, x]:
+                seed = ((x + 1 < width and mask[y, x + 1])
+                        or (x > 0 and mask[y, x - 1])
+                        or (y + 1 < height and mask[y + 1, x])
+                        or (y > 0 and mask[y - 1, x]))
+            f[y, x] = 0.0 if seed else _BIG
+    _edt_sq_2d(f)
+    out = np.empty((height, width), np.float32)
+    for y in prange(height):
+        for x in range(width):
+            distance = np.sqrt(f[y, x])
+            out[y, x] = distance if mask[y, x] else -distance
+    return out
+
+
+def _downsample_normalize(sdf: np.ndarray, out: np.ndarray, factor: int,
+                          max_distance: float) -> None:
+    """
+    Box-average the SDF by 'factor' and normalize to uint8 in one pass.
+
+    Each output pixel accumulates its factor x factor tile into a scalar
+    and writes the [0, 255]-mapped value directly, so no full-resolution
+    float intermediate is materialized.
+
+    :param sdf: Full-resolution signed distances, clipped to +-max_distance
+    :param out: Preallocated uint8 output with shape (H//factor, W//factor)
+    :param factor: Downsample factor
+    :param max_distance: Clip distance used to normalize into [0, 255]
+    """
+    inv_area = 1.0 / (factor * factor)
+    scale = 255.0 / (2.0 * max_distance)
+    for oy in prange(out.shape[0]):
+        for ox in range(out.shape[1]):
+            acc = 0.0
+            for dy in range(factor):
+                for dx in range(factor):
+                    acc += sdf[oy * factor + dy, ox * factor + dx]
+            value = (acc * inv_area + max_distance) * scale
+            if value < 0.0:
+                value = 0.0
+            elif value > 255.0:
+                value = 255.0
+            out[oy, ox] = np.uint8(value)
+
+
+if njit is not None:
+    _edt_1d = njit(cache=True, nogil=True)(_edt_1d)
+    _edt_sq_2d = njit(parallel=True, cache=True, nogil=True)(_edt_sq_2d)
+    _signed_edt = njit(parallel=True, cache=True, nogil=True)(_signed_edt)
+    _downsample_normalize = njit(parallel=True, fastmath=True, cache=True,
+                                 nogil=True)(_downsample_normalize)
+
+
+def downsample_normalize(sdf: np.ndarray, factor: int, max_distance: float) -> np.ndarray:
+    """
+    Downsample a signed distance field and normalize it to uint8.
+
+    :param sdf: Full-resolution signed distances, clipped to +-max_distance
+    :param factor: Downsample factor
+    :param max_distance: Clip distance used to normalize into [0, 255]
+    :return: uint8 array with shape (H // factor, W // factor)
+    """
+    height, width = sdf.shape
+    out = np.empty((height // factor, width // factor), np.uint8)
+    _downsample_normalize(sdf, out, factor, max_distance)
+    return out
+
+
+def signed_distance_field(mask: np.ndarray) -> np.ndarray:
+    """
+    Compute the signed Euclidean distance field of a foreground mask.
+
+    Equivalent to scipy's distance_transform_edt(mask) -
+    distance_transform_edt(~mask) up to the boundary convention: a
+    single transform runs from the boundary pixels, so exterior
+    magnitudes sit one pixel closer to zero than scipy's. In the
+    normalized 8-bit output that shifts exterior values by up to
+    255 / (2 * max_distance) gray levels (about 8 at the default
+    config); interior values are exact.
+
+    :param mask: Boolean foreground mask with shape (H, W)
+    :return: float32 field, positive inside the mask, negative outside
+    """
+    return _signed_edt(np.ascontiguousarray(mask))
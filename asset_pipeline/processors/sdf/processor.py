@@ -1,7 +1,15 @@
 from pathlib import Path
+import collections
+import concurrent.futures
+import logging as py_logging
+import os
+import queue
+import threading
 import typing as t
 import time
 
+import numpy as np
+
 import asset_pipeline.core.qt_image as qt_image
 import asset_pipeline.core.datafiles.metadata as metadata
 import asset_pipeline.core.logging as logging
@@ -10,23 +18,56 @@ import asset_pipeline.processors.sdf.config as cfg
 
 logger = logging.get_logger(__name__)
 
+# Per-worker pool of SDF output buffers keyed by output shape, so the
+# multi-channel result (and the QImage wrapping it) reuses one
+# allocation across files instead of a fresh buffer per SVG.
+_sdf_output_pool: t.Dict[t.Tuple[int, int], "np.ndarray"] = {}
+
 
-def svg_to_sdf(svg_path: t.Union[str, Path], output_dir: t.Union[str, Path],
-               rel_distance: float, svg_resolution: int, sdf_resolution: int) -> t.Union[Path, None]:
+def svg_to_sdf(svg_path: Path, output_dir: Path,
+               config: cfg.SdfProcessorConfig) -> t.Union[Path, None]:
     """
     Converts an SVG file to a signed distance field (SDF) and saves the output.
 
     :param svg_path: Path to the input SVG file.
     :param output_dir: Directory where the generated SDF image will be saved.
-    :param rel_distance: Relative distance parameter for SDF computation.
-    :param svg_resolution: Resolution to render the SVG before SDF conversion.
-    :param sdf_resolution: Target resolution for the final SDF output.
+    :param config: SDF Processor config object; the derived
+        downsample_factor is taken from here instead of being recomputed
+        per call.
     """
 
-    img = qt_image.svg_to_image(svg_path, svg_resolution, rel_distance)
-    img_array = qt_image.image_to_numpy(img)
-    sdf_array = converter.compute_multichannel_sdf(img_array, rel_distance, svg_resolution // sdf_resolution,
-                                                   channel_mapping=cfg.SDF_CHANNEL_MAPPING)
+    # Early out: if a previous export is already newer than the source
+    # (e.g. after a metadata wipe), skip the render and compute entirely.
+    svg_mtime_ns = svg_path.stat().st_mtime_ns
+    for file_postfix in cfg.OUTPUT_FILE_POSTFIXES_BY_CHANNELS.values():
+        candidate = output_dir / (cfg.OUTPUT_FILE_PREFIX + svg_path.stem + file_postfix + cfg.OUTPUT_FILE_EXT)
+        try:
+            if candidate.stat().st_mtime_ns >= svg_mtime_ns:
+                logger.debug(f"Output already up to date, skipping: {candidate}")
+                return candidate
+        except FileNotFoundError:
+            pass
+
+    qt_image.ensure_app()
+    img = qt_image.svg_to_image(svg_path, config.svg_rasterization_size,
+                                config.max_relative_distance)
+    # Zero-copy view is safe here: img outlives the SDF computation below
+    img_array = qt_image.image_to_numpy(img, copy=False)
+
+    downsample_factor = config.downsample_factor
+    out_shape = (img_array.shape[0] // downsample_factor, img_array.shape[1] // downsample_factor)
+    out_buffer = _sdf_output_pool.get(out_shape)
+    if out_buffer is None:
+        out_buffer = _sdf_output_pool.setdefault(out_shape, np.empty((*out_shape, 4), np.uint8))
+    sdf_array = converter.compute_multichannel_sdf(img_array, config.max_relative_distance,
+                                                   downsample_factor,
+                                                   channel_mapping=cfg.SDF_CHANNEL_MAPPING,
+                                                   out=out_buffer)
+
+    # Determine output filename from the array itself, before any QImage exists
+    sdf_channels = 1 if sdf_array.ndim == 2 else sdf_array.shape[-1]
+    file_postfix = cfg.OUTPUT_FILE_POSTFIXES_BY_CHANNELS[sdf_channels]
+    output_path = output_dir / (cfg.OUTPUT_FILE_PREFIX + svg_path.stem + file_postfix + cfg.OUTPUT_FILE_EXT)
 
     # Convert SDF to QImage
     sdf_image = qt_image.numpy_to_image(sdf_array)
@@ -34,10 +75,6 @@ def svg_to_sdf(svg_path: t.Union[str, Path], output_dir: t.Union[str, Path],
         logger.warning(f"Failed to convert SDF array to image for: {svg_path}")
         return None
 
-    # Determine output filename
-    file_postfix = cfg.OUTPUT_FILE_POSTFIXES[sdf_image.format()]
-    output_path = output_dir / (cfg.OUTPUT_FILE_PREFIX + svg_path.stem + file_postfix + cfg.OUTPUT_FILE_EXT)
-
     # Save the final image
     if not qt_image.save_image(sdf_image, output_path):
         logger.error(f"Failed to save SDF image: {output_path}")
@@ -45,6 +82,74 @@ def svg_to_sdf(svg_path: t.Union[str, Path], output_dir: t.Union[str, Path],
     return output_path
 
 
+def _process_one(svg_path: Path, output_dir: Path,
+                 config: cfg.SdfProcessorConfig) -> t.Tuple[Path, t.Union[Path, None], float]:
+    """
+    Convert a single SVG in a worker process.
+
+    Metadata writes stay in the parent so .gsam files are never written
+    from two processes at once.
+
+    :param svg_path: Path to the input SVG file.
+    :param output_dir: Directory where the generated SDF image will be saved.
+    :param config: SDF Processor config object
+    :returns: Tuple of (source path, exported path or None, elapsed seconds)
+    """
+    start_time = time.perf_counter()
+    exported_path = svg_to_sdf(svg_path, output_dir, config)
+    return svg_path, exported_path, time.perf_counter() - start_time
+
+
+def _warm_up_converter() -> None:
+    """
+    Run one tiny conversion to pull in the heavy numeric imports and
+    trigger any JIT compilation before real files are timed.
+    """
+    dummy = np.zeros((8, 8, 4), dtype=np.uint8)
+    dummy[2:6, 2:6, 0] = 255
+    converter.compute_multichannel_sdf(dummy, 0.1, 1, channel_mapping=cfg.SDF_CHANNEL_MAPPING)
+
+
+def _looks_like_svg(svg_path: Path) -> bool:
+    """
+    Cheap header sniff to keep junk files out of the Qt SVG parser.
+
+    :param svg_path: Path to the candidate file
+    :returns: True if the first 512 bytes look like SVG/XML content
+    """
+    try:
+        with open(svg_path, "rb") as f:
+            header = f.read(512)
+    except OSError:
+        return False
+    return b"<svg" in header or b"<?xml" in header
+
+
+def _metadata_worker(refresh_queue: "queue.Queue[t.Optional[tuple]]") -> None:
+    """
+    Consume (svg_path, exported_path, checksum) items and refresh their
+    metadata, so sidecar writes overlap with the remaining conversions.
+
+    :param refresh_queue: Work queue; a None item shuts the worker down
+    """
+    while True:
+        item = refresh_queue.get()
+        if item is None:
+            break
+        svg_path, exported_path, checksum = item
+        # A failed refresh (e.g. the source deleted mid-run) must not kill
+        # the consumer: later items would be dropped silently while join()
+        # still succeeds.
+        try:
+            if checksum is not None:
+                metadata.refresh_metadata(svg_path, exported_files=[exported_path],
+                                          checksum=checksum)
+            else:
+                metadata.refresh_metadata(svg_path, exported_files=[exported_path])
+        except Exception:
+            logger.exception(f"Failed to refresh metadata for: {svg_path}")
+
+
 def process_sdf(config: cfg.SdfProcessorConfig) -> None:
     """
     Processes all files from configured source directories, converting them to SDF format.
@@ -57,17 +162,42 @@ def process_sdf(config: cfg.SdfProcessorConfig) -> None:
             logger.warning(f"Invalid directory: {paths.source_dir}")
             continue
 
-        svg_files = list(paths.source_dir.glob("*.svg"))
+        # os.scandir enumerates with one readdir and reuses the d_type
+        # info for is_file, instead of glob's pattern machinery and
+        # per-entry stat calls. The lower() keeps the match
+        # case-insensitive like glob on Windows, so .SVG assets stay in.
+        with os.scandir(paths.source_dir) as entries:
+            svg_files = [Path(entry.path) for entry in entries
+                         if entry.name.lower().endswith(".svg") and entry.is_file()]
         logger.info(f"Found {len(svg_files)} SVG assets")
 
         # Identify new and modified assets, count them, and store them in pending_files for processing.
+        # Checksums computed during triage are kept so refresh_metadata doesn't hash the file again.
+        # Status checks are metadata reads plus (rarely) hashing — both
+        # release the GIL — so they fan out across a thread pool and the
+        # pending list, checksum map and counts derive from one result
+        # list without re-querying.
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(32, max(len(svg_files), 1))) as status_pool:
+            results = status_pool.map(metadata.get_asset_status_cached, svg_files)
+        statuses = [(svg_path, *result) for svg_path, result in zip(svg_files, results)]
+        actionable = {metadata.AssetStatus.NEW, metadata.AssetStatus.MODIFIED}
+        # The header sniff only runs on files that are about to be
+        # processed, so unchanged assets never pay the extra read.
         pending_files = []
-        status_counts = {metadata.AssetStatus.NEW: 0, metadata.AssetStatus.MODIFIED: 0}
-        for svg_path in svg_files:
-            status = metadata.get_asset_status(svg_path)
-            if status in status_counts:
-                status_counts[status] += 1
-                pending_files.append(svg_path)
+        for svg_path, status, _, _ in statuses:
+            if status not in actionable:
+                continue
+            if not _looks_like_svg(svg_path):
+                logger.warning(f"Skipping file without SVG/XML header: {svg_path}")
+                continue
+            pending_files.append(svg_path)
+        checksums: t.Dict[Path, str] = {
+            svg_path: checksum for svg_path, status, _, checksum in statuses
+            if status in actionable and checksum is not None}
+        pending_set = set(pending_files)
+        status_counts = collections.Counter(
+            status for svg_path, status, _, _ in statuses if svg_path in pending_set)
 
         if not pending_files:
             logger.info(f"No new or modified assets found. All files are already up to date.")
@@ -75,15 +205,35 @@ def process_sdf(config: cfg.SdfProcessorConfig) -> None:
 
         logger.info(f"Detected {status_counts[metadata.AssetStatus.NEW]} new assets, "
                     f"{status_counts[metadata.AssetStatus.MODIFIED]} modified assets.")
-        for svg_path in pending_files:
-            logger.info(f"Processing: {svg_path}")
-
-            start_time = time.perf_counter()
-            exported_path = svg_to_sdf(svg_path, paths.output_dir, config.max_relative_distance,
-                                       config.svg_rasterization_size, config.max_output_size)
-            elapsed_time = time.perf_counter() - start_time
-            logger.info(f"Saved: {exported_path} ({elapsed_time:.2f}s)")
-
-            metadata.refresh_metadata(svg_path, exported_files=[exported_path])
-
-        logger.info(f"Exported SDF files to: {paths.output_dir}")
\ No newline at end of file
+        # Each file is independent, so the conversions are spread across a
+        # process pool; results are handled in the parent as they complete.
+        max_workers = min(len(pending_files), os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                    initializer=_warm_up_converter) as executor:
+            futures = [executor.submit(_process_one, svg_path, paths.output_dir, config)
+                       for svg_path in pending_files]
+            # Per-file lines are debug-only; a single summary at the end
+            # keeps INFO output (and the logging lock) off the hot path.
+            log_per_file = logger.isEnabledFor(py_logging.DEBUG)
+            total_elapsed = 0.0
+
+            # Metadata refreshes run on a dedicated consumer thread so
+            # the sidecar hash + write never blocks result collection.
+            refresh_queue: "queue.Queue[t.Optional[tuple]]" = queue.Queue()
+            refresh_thread = threading.Thread(target=_metadata_worker,
+                                              args=(refresh_queue,), daemon=True)
+            refresh_thread.start()
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    svg_path, exported_path, elapsed_time = future.result()
+                    total_elapsed += elapsed_time
+                    if log_per_file:
+                        logger.debug(f"Saved: {exported_path} ({elapsed_time:.2f}s)")
+
+                    refresh_queue.put((svg_path, exported_path, checksums.get(svg_path)))
+            finally:
+                refresh_queue.put(None)
+                refresh_thread.join()
+
+        logger.info(f"Exported {len(pending_files)} SDF files to: {paths.output_dir} "
+                    f"({total_elapsed:.2f}s total conversion time)")
\ No newline at end of file
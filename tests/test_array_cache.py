@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+import asset_pipeline.core.datafiles.array_cache as array_cache
+
+
+def test_save_load_round_trip(tmp_path):
+    """Test that an array survives a save/load round trip unchanged."""
+    rng = np.random.default_rng(3)
+    array = rng.integers(0, 256, (32, 16, 4), dtype=np.uint8)
+    cache_path = tmp_path / "image.gsac"
+
+    array_cache.save_array(array, cache_path)
+    loaded = array_cache.load_array(cache_path)
+
+    assert loaded.dtype == array.dtype
+    assert loaded.shape == array.shape
+    assert (loaded == array).all()
+
+
+def test_round_trip_preserves_dtype(tmp_path):
+    """Test round-tripping a non-uint8 dtype."""
+    array = np.linspace(-1.0, 1.0, 64, dtype=np.float32).reshape(8, 8)
+    cache_path = tmp_path / "sdf.gsac"
+
+    array_cache.save_array(array, cache_path)
+    loaded = array_cache.load_array(cache_path)
+
+    assert loaded.dtype == np.float32
+    assert np.array_equal(loaded, array)
+
+
+def test_load_rejects_wrong_magic(tmp_path):
+    """Test that a file without the cache magic raises ValueError."""
+    bogus_path = tmp_path / "bogus.gsac"
+    bogus_path.write_bytes(b"NOPE" + b"\x00" * 16)
+
+    with pytest.raises(ValueError):
+        array_cache.load_array(bogus_path)
@@ -0,0 +1,66 @@
+import struct
+
+import numpy as np
+import pytest
+
+import asset_pipeline.core.dds as dds
+
+
+def _solid_chain(base_size, colors):
+    """Build a mip chain of solid-color levels halving down from base_size."""
+    size = base_size
+    chain = []
+    for color in colors:
+        chain.append(np.full((size, size, 4), color, dtype=np.uint8))
+        size = max(1, size // 2)
+    return chain
+
+
+def test_save_dds_layout(tmp_path):
+    """Test the written header fields and payload against the DDS layout."""
+    chain = _solid_chain(8, [[255, 0, 0, 255], [0, 255, 0, 255], [0, 0, 255, 255]])
+    dds_path = tmp_path / "out.dds"
+
+    dds.save_dds_from_mipmaps(chain, dds_path)
+    raw = dds_path.read_bytes()
+
+    assert raw[:4] == b"DDS "
+    header_size, flags = struct.unpack_from("<II", raw, 4)
+    assert header_size == 124
+    height, width, pitch = struct.unpack_from("<3I", raw, 12)
+    assert (height, width, pitch) == (8, 8, 32)
+    (mip_count,) = struct.unpack_from("<I", raw, 28)
+    assert mip_count == 3
+    # Pixel format: 32 bpp RGBA with the expected bitmasks
+    pf = struct.unpack_from("<IIIIIIII", raw, 76)
+    assert pf == (32, 0x41, 0, 32, 0x00FF0000, 0x0000FF00, 0x000000FF, 0xFF000000)
+    (caps1,) = struct.unpack_from("<I", raw, 108)
+    assert caps1 == 0x1000 | 0x8 | 0x400000
+
+    # Payload: all mip levels back to back starting at offset 128
+    payload = b"".join(level.tobytes() for level in chain)
+    assert raw[128:] == payload
+
+
+def test_save_dds_rejects_bad_chain(tmp_path):
+    """Test validation of dtype and level dimensions."""
+    dds_path = tmp_path / "bad.dds"
+    with pytest.raises(ValueError):
+        dds.save_dds_from_mipmaps([], dds_path)
+    with pytest.raises(ValueError):
+        dds.save_dds_from_mipmaps([np.zeros((8, 8, 4), dtype=np.float32)], dds_path)
+    with pytest.raises(ValueError):
+        dds.save_dds_from_mipmaps([np.zeros((8, 8, 4), dtype=np.uint8),
+                                   np.zeros((8, 8, 4), dtype=np.uint8)], dds_path)
+
+
+def test_save_dds_validate_false_writes_same_bytes(tmp_path):
+    """Test that skipping validation produces an identical file."""
+    chain = _solid_chain(4, [[10, 20, 30, 40], [50, 60, 70, 80]])
+    checked = tmp_path / "checked.dds"
+    unchecked = tmp_path / "unchecked.dds"
+
+    dds.save_dds_from_mipmaps(chain, checked)
+    dds.save_dds_from_mipmaps(chain, unchecked, validate=False)
+
+    assert checked.read_bytes() == unchecked.read_bytes()
@@ -37,4 +37,18 @@ def test_save_and_load_metadata(mock_asset_path):
     assert loaded_metadata.uuid == metadata.uuid
     assert loaded_metadata.checksum == metadata.checksum
 
-    metadata_path.unlink()
\ No newline at end of file
+    metadata_path.unlink()
+
+
+def test_get_asset_status(mock_asset_path):
+    """Test asset status detection for new, unchanged and modified assets."""
+    assert md.get_asset_status(mock_asset_path) == md.AssetStatus.NEW
+
+    md.retrieve_metadata(mock_asset_path)
+    assert md.get_asset_status(mock_asset_path) == md.AssetStatus.UNCHANGED
+
+    with open(mock_asset_path, "w") as f:
+        f.write("This asset file was modified.")
+    assert md.get_asset_status(mock_asset_path) == md.AssetStatus.MODIFIED
+
+    md.get_metadata_path(mock_asset_path).unlink()
\ No newline at end of file
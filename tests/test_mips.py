@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+import asset_pipeline.core.mips as mips
+
+
+def test_get_num_mips():
+    """Test mip counts for a full chain down to 1x1."""
+    assert mips.get_num_mips(1, 1) == 1
+    assert mips.get_num_mips(256, 256) == 9
+    assert mips.get_num_mips(512, 64) == 10
+
+
+def test_get_all_mipmap_coordinates():
+    """Test atlas coordinates for a non-square chain."""
+    coords = mips.get_all_mipmap_coordinates(8, 4)
+    assert coords == [(0, 0, 8, 4), (8, 0, 4, 2), (12, 0, 2, 1), (14, 0, 1, 1)]
+
+
+def test_generate_mipmaps_chain():
+    """Test that each generated level is a rounded 2x2 box average."""
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, (16, 16, 4), dtype=np.uint8)
+
+    chain = mips.generate_mipmaps(image)
+
+    assert len(chain) == mips.get_num_mips(16, 16)
+    assert chain[0] is image
+    for prev, nxt in zip(chain, chain[1:]):
+        height, width = prev.shape[:2]
+        assert nxt.shape == (max(1, height // 2), max(1, width // 2), 4)
+        if height > 1 and width > 1:
+            sums = prev.astype(np.uint16)
+            sums = sums[0::2] + sums[1::2]
+            sums = sums[:, 0::2] + sums[:, 1::2]
+            expected = ((sums + 2) >> 2).astype(np.uint8)
+            assert (nxt == expected).all()
+    assert chain[-1].shape == (1, 1, 4)
+
+
+def test_generate_mipmaps_rejects_bad_input():
+    """Test input validation for shape, dtype and dimensions."""
+    with pytest.raises(ValueError):
+        mips.generate_mipmaps(np.zeros((16, 16, 3), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        mips.generate_mipmaps(np.zeros((16, 16, 4), dtype=np.float32))
+    with pytest.raises(ValueError):
+        mips.generate_mipmaps(np.zeros((12, 16, 4), dtype=np.uint8))
@@ -0,0 +1,35 @@
+import json
+
+import asset_pipeline.core.datafiles.serialization as ser
+
+MAGIC = b"GSTT"
+
+
+def test_save_load_packed_round_trip(tmp_path):
+    """Test that nested data survives a packed save/load round trip."""
+    data = {"version": 2, "files": ["a.png", "b.png"], "nested": {"ok": True, "ratio": 0.5}}
+    packed_path = tmp_path / "data.gsam"
+
+    ser.save_packed(data, packed_path, MAGIC)
+    assert ser.load_packed(packed_path, MAGIC) == data
+
+
+def test_packed_file_starts_with_magic_and_version(tmp_path):
+    """Test the packed on-disk layout when msgpack is available."""
+    if ser.msgpack is None:
+        return
+    packed_path = tmp_path / "data.gsam"
+    ser.save_packed({"key": "value"}, packed_path, MAGIC)
+
+    raw = packed_path.read_bytes()
+    assert raw[:4] == MAGIC
+    assert raw[4] == ser.PACKED_FORMAT_VERSION
+
+
+def test_load_packed_reads_legacy_json(tmp_path):
+    """Test that load_packed still reads pre-packed JSON files."""
+    data = {"checksum": "abc123", "exported_files": []}
+    legacy_path = tmp_path / "legacy.gsam"
+    legacy_path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert ser.load_packed(legacy_path, MAGIC) == data